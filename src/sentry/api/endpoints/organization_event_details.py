@@ -23,8 +23,14 @@ from sentry.search.events.types import QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.query_sources import QuerySource
 from sentry.snuba.referrer import Referrer
+from sentry.utils.cache import cache
 
 VALID_AVERAGE_COLUMNS = {"span.self_time", "span.duration"}
+AVERAGE_SPAN_CACHE_TTL = 60
+
+
+def get_average_span_cache_key(project_id: int, group: str, average_columns) -> str:
+    return f"event-details:average-span:{project_id}:{group}:{','.join(sorted(average_columns))}"
 
 
 def add_comparison_to_event(event, average_columns, request: Request):
@@ -43,50 +49,76 @@ def add_comparison_to_event(event, average_columns, request: Request):
     if len(group_to_span_map) == 0:
         return
 
-    with handle_query_errors():
-        builder = SpansMetricsQueryBuilder(
-            dataset=Dataset.PerformanceMetrics,
-            params={
-                "start": start,
-                "end": end,
-                "project_objects": [event.project],
-                "organization_id": event.organization.id,
-            },
-            selected_columns=[
-                "span.group",
-                *[f"avg({average_column})" for average_column in average_columns],
-            ],
-            config=QueryBuilderConfig(transform_alias_to_input_format=True),
-            # orderby shouldn't matter, just picking something so results are consistent
-            orderby=["span.group"],
-        )
-        builder.add_conditions(
-            [
-                Condition(
-                    Column(builder.resolve_column_name("span.group")),
-                    Op.IN,
-                    Function("tuple", list(group_to_span_map.keys())),
+    # Averages are over the last 24h, so they barely move within the cache ttl. Only query the
+    # groups we haven't seen recently.
+    cache_keys = {
+        group: get_average_span_cache_key(event.project.id, group, average_columns)
+        for group in group_to_span_map
+    }
+    cached_averages = cache.get_many(cache_keys.values())
+    group_to_averages = {
+        group: cached_averages[key] for group, key in cache_keys.items() if key in cached_averages
+    }
+    missing_groups = [group for group in group_to_span_map if group not in group_to_averages]
+    sentry_sdk.set_measurement("query.groups_cached", len(group_to_averages))
+
+    if missing_groups:
+        with handle_query_errors():
+            builder = SpansMetricsQueryBuilder(
+                dataset=Dataset.PerformanceMetrics,
+                params={
+                    "start": start,
+                    "end": end,
+                    "project_objects": [event.project],
+                    "organization_id": event.organization.id,
+                },
+                selected_columns=[
+                    "span.group",
+                    *[f"avg({average_column})" for average_column in average_columns],
+                ],
+                config=QueryBuilderConfig(transform_alias_to_input_format=True),
+                # orderby shouldn't matter, just picking something so results are consistent
+                orderby=["span.group"],
+            )
+            builder.add_conditions(
+                [
+                    Condition(
+                        Column(builder.resolve_column_name("span.group")),
+                        Op.IN,
+                        Function("tuple", missing_groups),
+                    )
+                ]
+            )
+            result = builder.process_results(
+                builder.run_query(
+                    referrer=Referrer.API_PERFORMANCE_ORG_EVENT_AVERAGE_SPAN.value,
+                    query_source=(
+                        QuerySource.FRONTEND if is_frontend_request(request) else QuerySource.API
+                    ),
                 )
-            ]
-        )
-        result = builder.process_results(
-            builder.run_query(
-                referrer=Referrer.API_PERFORMANCE_ORG_EVENT_AVERAGE_SPAN.value,
-                query_source=(
-                    QuerySource.FRONTEND if is_frontend_request(request) else QuerySource.API
-                ),
             )
-        )
         sentry_sdk.set_measurement("query.groups_found", len(result["data"]))
-        for row in result["data"]:
-            group = row["span.group"]
-            for span in group_to_span_map[group]:
-                average_results = {}
-                for col in row:
-                    if col.startswith("avg") and row[col] > 0:
-                        average_results[col] = row[col]
-                if average_results:
-                    span["span.averageResults"] = average_results
+
+        # Groups without data are cached too, so we don't keep querying for them
+        fetched_averages: dict[str, dict[str, float]] = {group: {} for group in missing_groups}
+        if result["data"]:
+            avg_cols = [col for col in result["data"][0] if col.startswith("avg")]
+            for row in result["data"]:
+                # Every span in a group gets the same averages, so only compute them once per group
+                fetched_averages[row["span.group"]] = {
+                    col: row[col] for col in avg_cols if row[col] > 0
+                }
+        cache.set_many(
+            {cache_keys[group]: averages for group, averages in fetched_averages.items()},
+            timeout=AVERAGE_SPAN_CACHE_TTL,
+        )
+        group_to_averages.update(fetched_averages)
+
+    for group, average_results in group_to_averages.items():
+        if not average_results:
+            continue
+        for span in group_to_span_map[group]:
+            span["span.averageResults"] = average_results
 
 
 @region_silo_endpoint
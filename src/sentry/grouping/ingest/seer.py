@@ -1,5 +1,4 @@
 import logging
-from dataclasses import asdict
 
 from django.conf import settings
 
@@ -19,11 +18,16 @@ from sentry.seer.similarity.utils import (
     killswitch_enabled,
 )
 from sentry.utils import metrics
-from sentry.utils.circuit_breaker2 import CircuitBreaker
+from sentry.utils.circuit_breaker2 import CircuitBreaker, CircuitBreakerConfig
 from sentry.utils.safe import get_path
 
 logger = logging.getLogger("sentry.events.grouping")
 
+# Per the `CircuitBreaker` docstring, an instance holds no breaker state of its own (just its config,
+# a redis limiter, and a redis pipeline), so one can be shared across events as long as the config
+# hasn't changed
+_circuit_breakers: dict[frozenset[tuple[str, object]], CircuitBreaker] = {}
+
 
 def should_call_seer_for_grouping(event: Event, primary_hashes: CalculatedHashes) -> bool:
     """
@@ -77,24 +81,22 @@ def _project_has_similarity_grouping_enabled(project: Project) -> bool:
 def _has_customized_fingerprint(event: Event, primary_hashes: CalculatedHashes) -> bool:
     fingerprint = event.data.get("fingerprint", [])
 
+    # No custom fingerprinting at all (checked first since it's by far the most common case)
+    if len(fingerprint) == 1 and fingerprint[0] == "{{ default }}":
+        return False
+
+    # Hybrid fingerprinting ({{ default }} + some other value(s))
     if "{{ default }}" in fingerprint:
-        # No custom fingerprinting at all
-        if len(fingerprint) == 1:
-            return False
-
-        # Hybrid fingerprinting ({{ default }} + some other value(s))
-        else:
-            metrics.incr(
-                "grouping.similarity.did_call_seer",
-                sample_rate=1.0,
-                tags={"call_made": False, "blocker": "hybrid-fingerprint"},
-            )
-            return True
+        metrics.incr(
+            "grouping.similarity.did_call_seer",
+            sample_rate=1.0,
+            tags={"call_made": False, "blocker": "hybrid-fingerprint"},
+        )
+        return True
 
     # Fully customized fingerprint (from either us or the user)
-    fingerprint_variant = primary_hashes.variants.get(
-        "custom-fingerprint"
-    ) or primary_hashes.variants.get("built-in-fingerprint")
+    variants = primary_hashes.variants
+    fingerprint_variant = variants.get("custom-fingerprint") or variants.get("built-in-fingerprint")
 
     if fingerprint_variant:
         metrics.incr(
@@ -120,7 +122,25 @@ def _ratelimiting_enabled(event: Event, project: Project) -> bool:
 
     logger_extra = {"event_id": event.event_id, "project_id": project.id}
 
-    if ratelimiter.backend.is_limited("seer:similarity:global-limit", **global_ratelimit):
+    # Check both limits in a single round trip. (This means the project counter is incremented even
+    # when the global limit is hit, the same way the global counter already is when the project
+    # limit is hit.)
+    global_limit_hit, project_limit_hit = ratelimiter.backend.is_limited_batch(
+        [
+            (
+                "seer:similarity:global-limit",
+                global_ratelimit["limit"],
+                global_ratelimit["window"],
+            ),
+            (
+                f"seer:similarity:project-{project.id}-limit",
+                per_project_ratelimit["limit"],
+                per_project_ratelimit["window"],
+            ),
+        ]
+    )
+
+    if global_limit_hit:
         logger_extra["limit_per_sec"] = global_limit_per_sec
         logger.warning("should_call_seer_for_grouping.global_ratelimit_hit", extra=logger_extra)
 
@@ -136,9 +156,7 @@ def _ratelimiting_enabled(event: Event, project: Project) -> bool:
 
         return True
 
-    if ratelimiter.backend.is_limited(
-        f"seer:similarity:project-{project.id}-limit", **per_project_ratelimit
-    ):
+    if project_limit_hit:
         logger_extra["limit_per_sec"] = project_limit_per_sec
         logger.warning("should_call_seer_for_grouping.project_ratelimit_hit", extra=logger_extra)
 
@@ -157,9 +175,22 @@ def _ratelimiting_enabled(event: Event, project: Project) -> bool:
     return False
 
 
+def _get_circuit_breaker(breaker_config: CircuitBreakerConfig) -> CircuitBreaker:
+    cache_key = frozenset(breaker_config.items())
+    circuit_breaker = _circuit_breakers.get(cache_key)
+
+    if circuit_breaker is None:
+        circuit_breaker = CircuitBreaker(
+            settings.SEER_SIMILARITY_CIRCUIT_BREAKER_KEY, breaker_config
+        )
+        _circuit_breakers[cache_key] = circuit_breaker
+
+    return circuit_breaker
+
+
 def _circuit_breaker_broken(event: Event, project: Project) -> bool:
     breaker_config = options.get("seer.similarity.circuit-breaker-config")
-    circuit_breaker = CircuitBreaker(settings.SEER_SIMILARITY_CIRCUIT_BREAKER_KEY, breaker_config)
+    circuit_breaker = _get_circuit_breaker(breaker_config)
     circuit_broken = not circuit_breaker.should_allow_request()
 
     if circuit_broken:
@@ -217,20 +248,22 @@ def get_seer_similar_issues(
 
     # Similar issues are returned with the closest match first
     seer_results = get_similarity_data_from_seer(request_data)
-    similar_issues_metadata = asdict(SeerSimilarIssuesMetadata(results=seer_results))
+    similar_issues_metadata = SeerSimilarIssuesMetadata(results=seer_results).to_dict()
     parent_group = (
         Group.objects.filter(id=seer_results[0].parent_group_id).first() if seer_results else None
     )
 
-    logger.info(
-        "get_seer_similar_issues.results",
-        extra={
-            "event_id": event.event_id,
-            "project_id": event.project.id,
-            "hash": event_hash,
-            "results": similar_issues_metadata["results"],
-            "group_returned": bool(parent_group),
-        },
-    )
+    # This runs for every event sent to Seer, so don't build the log payload unless it'll be used
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "get_seer_similar_issues.results",
+            extra={
+                "event_id": event.event_id,
+                "project_id": event.project.id,
+                "hash": event_hash,
+                "results": similar_issues_metadata["results"],
+                "group_returned": bool(parent_group),
+            },
+        )
 
     return (similar_issues_metadata, parent_group)
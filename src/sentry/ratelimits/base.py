@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from sentry.utils.services import Service
@@ -9,7 +10,13 @@ if TYPE_CHECKING:
 
 
 class RateLimiter(Service):
-    __all__ = ("is_limited", "validate", "current_value", "is_limited_with_value")
+    __all__ = (
+        "is_limited",
+        "validate",
+        "current_value",
+        "is_limited_with_value",
+        "is_limited_batch",
+    )
 
     window = 60
 
@@ -19,6 +26,13 @@ class RateLimiter(Service):
         is_limited, _, _ = self.is_limited_with_value(key, limit, project=project, window=window)
         return is_limited
 
+    def is_limited_batch(self, checks: Sequence[tuple[str, int, int | None]]) -> list[bool]:
+        """
+        Check several `(key, limit, window)` rate limits at once, returning whether each one is
+        limited. Every counter is incremented, regardless of the other checks' results.
+        """
+        return [self.is_limited(key, limit, window=window) for key, limit, window in checks]
+
     def current_value(
         self, key: str, project: Project | None = None, window: int | None = None
     ) -> int:
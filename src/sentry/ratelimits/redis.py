@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -118,3 +119,27 @@ class RedisRateLimiter(RateLimiter):
             return False, 0, reset_time
 
         return result > limit, result, reset_time
+
+    def is_limited_batch(self, checks: Sequence[tuple[str, int, int | None]]) -> list[bool]:
+        """
+        Does the rate limit checks for all the given `(key, limit, window)` tuples in a single
+        redis round trip
+        """
+        request_time = time()
+        try:
+            pipe = self.client.pipeline()
+            for key, _, window in checks:
+                if window is None or window == 0:
+                    window = self.window
+                redis_key = self._construct_redis_key(key, window=window, request_time=request_time)
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, window - int(request_time % window))
+            pipeline_result = pipe.execute()
+        except RedisError:
+            # We don't want rate limited endpoints to fail when ratelimits
+            # can't be updated. We do want to know when that happens.
+            logger.exception("Failed to retrieve current value from redis")
+            return [False] * len(checks)
+
+        # Every check issued an INCR followed by an EXPIRE, so the counts are every other result
+        return [result > limit for (_, limit, _), result in zip(checks, pipeline_result[::2])]
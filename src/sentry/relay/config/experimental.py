@@ -1,6 +1,8 @@
 import logging
+import time
 from collections.abc import Callable, MutableMapping
-from datetime import datetime, timedelta, timezone
+from contextlib import AbstractContextManager, nullcontext
+from datetime import timedelta
 from typing import Any, Protocol, TypeVar
 
 import sentry_sdk
@@ -26,16 +28,20 @@ class TimeChecker:
 
     def __init__(self, hard_timeout: timedelta) -> None:
         self._hard_timeout = hard_timeout
-        self._start = datetime.now(timezone.utc)
+        # `check` is called often while building configs, so compare plain monotonic floats
+        # rather than building datetimes on every call.
+        self._start = time.monotonic()
+        self._deadline: float | None = None
+        if hard_timeout > timedelta(0):
+            self._deadline = self._start + hard_timeout.total_seconds()
 
     def check(self) -> None:
-        if self._hard_timeout <= timedelta(0):
+        if self._deadline is None:
             return
 
-        now = datetime.now(timezone.utc)
-        elapsed = now - self._start
-        if elapsed >= self._hard_timeout:
-            raise TimeoutException(elapsed, self._hard_timeout)
+        now = time.monotonic()
+        if now >= self._deadline:
+            raise TimeoutException(timedelta(seconds=now - self._start), self._hard_timeout)
 
 
 class ExperimentalConfigBuilder(Protocol):
@@ -83,7 +89,13 @@ def build_safe_config(
     """
     timeout = TimeChecker(_FEATURE_BUILD_TIMEOUT)
 
-    with sentry_sdk.start_span(op=f"project_config.build_safe_config.{key}"):
+    # Most builders are cheap, so only pay for a span when it will actually be recorded.
+    current_span = sentry_sdk.get_current_span()
+    span: AbstractContextManager[Any] = nullcontext()
+    if current_span is not None and current_span.sampled:
+        span = sentry_sdk.start_span(op=f"project_config.build_safe_config.{key}")
+
+    with span:
         try:
             return function(timeout, *args, **kwargs)
         except TimeoutException as e:
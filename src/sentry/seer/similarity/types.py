@@ -110,8 +110,30 @@ class SeerSimilarIssueData:
 
         return cls(**similar_issue_data)
 
+    def to_dict(self) -> dict[str, float | bool | int | str]:
+        """
+        Equivalent to `dataclasses.asdict`, but without the recursive reflection, since this is
+        called on every event we send to Seer during ingest.
+        """
+        return {
+            "stacktrace_distance": self.stacktrace_distance,
+            "message_distance": self.message_distance,
+            "should_group": self.should_group,
+            "parent_group_id": self.parent_group_id,
+            "parent_hash": self.parent_hash,
+        }
+
 
 @dataclass
 class SeerSimilarIssuesMetadata:
     results: list[SeerSimilarIssueData]
     similarity_model_version: str = SEER_SIMILARITY_MODEL_VERSION
+
+    def to_dict(self) -> dict[str, str | list[dict[str, float | bool | int | str]]]:
+        """
+        Equivalent to `dataclasses.asdict`, but without the recursive reflection.
+        """
+        return {
+            "results": [result.to_dict() for result in self.results],
+            "similarity_model_version": self.similarity_model_version,
+        }
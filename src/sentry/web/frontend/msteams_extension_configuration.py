@@ -15,14 +15,9 @@ class MsTeamsExtensionConfigurationView(IntegrationExtensionConfigurationView):
 
     def map_params_to_state(self, params):
         # decode the signed params and add them to whatever params we have
-        params = params.copy()
-        signed_params = params["signed_params"]
-        del params["signed_params"]
-        params.update(
-            unsign(
-                signed_params,
-                max_age=INSTALL_EXPIRATION_TIME,
-                salt=SALT,
-            )
+        unsigned_params = unsign(
+            params["signed_params"],
+            max_age=INSTALL_EXPIRATION_TIME,
+            salt=SALT,
         )
-        return params
+        return {k: v for k, v in params.items() if k != "signed_params"} | unsigned_params
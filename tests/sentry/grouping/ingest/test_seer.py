@@ -3,7 +3,11 @@ from unittest.mock import MagicMock, patch
 
 from sentry.conf.server import SEER_SIMILARITY_MODEL_VERSION
 from sentry.eventstore.models import Event
-from sentry.grouping.ingest.seer import get_seer_similar_issues, should_call_seer_for_grouping
+from sentry.grouping.ingest.seer import (
+    _circuit_breakers,
+    get_seer_similar_issues,
+    should_call_seer_for_grouping,
+)
 from sentry.grouping.result import CalculatedHashes
 from sentry.seer.similarity.types import SeerSimilarIssueData
 from sentry.testutils.cases import TestCase
@@ -11,6 +15,7 @@ from sentry.testutils.helpers import Feature
 from sentry.testutils.helpers.eventprocessing import save_new_event
 from sentry.testutils.helpers.features import with_feature
 from sentry.testutils.helpers.options import override_options
+from sentry.utils.circuit_breaker2 import CircuitBreaker
 from sentry.utils.types import NonNone
 
 
@@ -95,10 +100,11 @@ class ShouldCallSeerTest(TestCase):
     def test_obeys_global_ratelimit(self):
         for ratelimit_enabled, expected_result in [(True, False), (False, True)]:
             with patch(
-                "sentry.grouping.ingest.seer.ratelimiter.backend.is_limited",
-                wraps=lambda key, is_enabled=ratelimit_enabled, **_kwargs: (
+                "sentry.grouping.ingest.seer.ratelimiter.backend.is_limited_batch",
+                wraps=lambda checks, is_enabled=ratelimit_enabled: [
                     is_enabled if key == "seer:similarity:global-limit" else False
-                ),
+                    for key, _limit, _window in checks
+                ],
             ):
                 assert (
                     should_call_seer_for_grouping(self.event, self.primary_hashes)
@@ -109,12 +115,15 @@ class ShouldCallSeerTest(TestCase):
     def test_obeys_project_ratelimit(self):
         for ratelimit_enabled, expected_result in [(True, False), (False, True)]:
             with patch(
-                "sentry.grouping.ingest.seer.ratelimiter.backend.is_limited",
-                wraps=lambda key, is_enabled=ratelimit_enabled, **_kwargs: (
-                    is_enabled
-                    if key == f"seer:similarity:project-{self.project.id}-limit"
-                    else False
-                ),
+                "sentry.grouping.ingest.seer.ratelimiter.backend.is_limited_batch",
+                wraps=lambda checks, is_enabled=ratelimit_enabled: [
+                    (
+                        is_enabled
+                        if key == f"seer:similarity:project-{self.project.id}-limit"
+                        else False
+                    )
+                    for key, _limit, _window in checks
+                ],
             ):
                 assert (
                     should_call_seer_for_grouping(self.event, self.primary_hashes)
@@ -133,6 +142,27 @@ class ShouldCallSeerTest(TestCase):
                     is expected_result
                 )
 
+    @with_feature("projects:similarity-embeddings-grouping")
+    def test_reuses_circuit_breaker_for_same_config(self):
+        with patch(
+            "sentry.grouping.ingest.seer.CircuitBreaker", wraps=CircuitBreaker
+        ) as mock_circuit_breaker, patch.dict(_circuit_breakers, clear=True):
+            should_call_seer_for_grouping(self.event, self.primary_hashes)
+            should_call_seer_for_grouping(self.event, self.primary_hashes)
+            assert mock_circuit_breaker.call_count == 1
+
+            with override_options(
+                {
+                    "seer.similarity.circuit-breaker-config": {
+                        "error_limit": 1000,
+                        "error_limit_window": 600,
+                        "broken_state_duration": 300,
+                    }
+                }
+            ):
+                should_call_seer_for_grouping(self.event, self.primary_hashes)
+            assert mock_circuit_breaker.call_count == 2
+
     @with_feature("projects:similarity-embeddings-grouping")
     def test_obeys_customized_fingerprint_check(self):
         default_fingerprint_event = Event(
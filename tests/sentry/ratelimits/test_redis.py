@@ -19,6 +19,20 @@ class RedisRateLimiterTest(TestCase):
             assert not self.backend.is_limited("foo", 1)
             assert self.backend.is_limited("foo", 1)
 
+    def test_is_limited_batch(self):
+        with freeze_time("2000-01-01"):
+            assert self.backend.is_limited_batch([("foo", 1, None), ("bar", 2, 10)]) == [
+                False,
+                False,
+            ]
+            assert self.backend.is_limited_batch([("foo", 1, None), ("bar", 2, 10)]) == [
+                True,
+                False,
+            ]
+            assert self.backend.current_value("foo") == 2
+            assert self.backend.current_value("bar", window=10) == 2
+            assert self.backend.is_limited("bar", 2, window=10)
+
     def test_correct_current_value(self):
         """Ensure that current_value get the correct value after the counter in incremented"""
 
@@ -1,6 +1,6 @@
 from datetime import timedelta
 from time import sleep
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -99,3 +99,20 @@ def test_build_safe_config_returns_value_passed_as_arg_on_exception():
     result = build_safe_config("key", dummy, default_return="bar")
 
     assert result == "bar"
+
+
+@patch("sentry.relay.config.experimental.sentry_sdk.start_span")
+def test_build_safe_config_skips_span_without_sampled_parent(mock_start_span):
+    def dummy(*args, **kwargs):
+        return "foo"
+
+    with patch("sentry.relay.config.experimental.sentry_sdk.get_current_span", return_value=None):
+        assert build_safe_config("key", dummy) == "foo"
+    assert not mock_start_span.called
+
+    with patch(
+        "sentry.relay.config.experimental.sentry_sdk.get_current_span",
+        return_value=MagicMock(sampled=True),
+    ):
+        assert build_safe_config("key", dummy) == "foo"
+    mock_start_span.assert_called_once_with(op="project_config.build_safe_config.key")
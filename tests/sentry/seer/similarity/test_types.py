@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Any
 
 import pytest
@@ -6,6 +7,7 @@ from sentry.seer.similarity.types import (
     IncompleteSeerDataError,
     RawSeerSimilarIssueData,
     SeerSimilarIssueData,
+    SeerSimilarIssuesMetadata,
     SimilarGroupNotFoundError,
 )
 from sentry.testutils.cases import TestCase
@@ -111,3 +113,16 @@ class SeerSimilarIssueDataTest(TestCase):
             }
 
             SeerSimilarIssueData.from_raw(self.project.id, raw_similar_issue_data)
+
+    def test_to_dict_matches_asdict(self):
+        similar_issue_data = SeerSimilarIssueData(
+            stacktrace_distance=0.01,
+            message_distance=0.05,
+            should_group=True,
+            parent_group_id=1121201212312012,
+            parent_hash="04152013090820131121201212312012",
+        )
+        metadata = SeerSimilarIssuesMetadata(results=[similar_issue_data])
+
+        assert similar_issue_data.to_dict() == asdict(similar_issue_data)
+        assert metadata.to_dict() == asdict(metadata)
@@ -1,10 +1,12 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.urls import NoReverseMatch, reverse
 
 from sentry.models.group import Group
 from sentry.search.events import constants
+from sentry.search.events.builder.spans_metrics import SpansMetricsQueryBuilder
 from sentry.testutils.cases import APITestCase, MetricsEnhancedPerformanceTestCase, SnubaTestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
 from sentry.testutils.helpers.options import override_options
@@ -384,6 +386,29 @@ class EventComparisonTest(MetricsEnhancedPerformanceTestCase):
                     if span["op"] == "django.middlewares":
                         assert self.RESULT_COLUMN not in span
 
+    def test_get_uses_cached_averages(self):
+        with (
+            self.feature("organizations:insights-initial-modules"),
+            patch(
+                "sentry.api.endpoints.organization_event_details.SpansMetricsQueryBuilder",
+                wraps=SpansMetricsQueryBuilder,
+            ) as mock_builder,
+        ):
+            for _ in range(2):
+                response = self.client.get(self.url, {"averageColumn": "span.self_time"})
+                assert response.status_code == 200, response.content
+                entries = response.data["entries"]  # type: ignore[attr-defined]
+                for entry in entries:
+                    if entry["type"] == "spans":
+                        for span in entry["data"]:
+                            if span["op"] == "db":
+                                assert span[self.RESULT_COLUMN] == {"avg(span.self_time)": 1.0}
+                            if span["op"] == "django.middleware":
+                                assert self.RESULT_COLUMN not in span
+
+        # The second request is served entirely from the cache
+        assert mock_builder.call_count == 1
+
     def test_nan_column(self):
         # If there's nothing stored for a metric, span.duration in this case the query returns nan
         with self.feature("organizations:insights-initial-modules"):